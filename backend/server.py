@@ -1,8 +1,9 @@
 from fastapi import FastAPI, APIRouter, Depends, HTTPException, UploadFile, File, Request, Response, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import OperationFailure, PyMongoError
 import os
 import logging
 from pathlib import Path
@@ -11,22 +12,91 @@ from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone, timedelta
 import httpx
+from cachetools import TTLCache
 import base64
+import binascii
 from io import BytesIO
 from PIL import Image
 import pytesseract
+import numpy as np
 import re
+import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tesserocr  # in-process libtesseract, avoids a subprocess per scan
+except ImportError:
+    tesserocr = None
+
+try:
+    import hyperscan  # single-pass multi-pattern scanning of OCR text
+except ImportError:
+    hyperscan = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# OCR extraction patterns
+VIN_RE = re.compile(r'\b[A-HJ-NPR-Z0-9]{17}\b')  # 17 characters, alphanumeric
+PLATE_RE = re.compile(r'\b\d{2}\s*[A-Z]{1,3}\s*\d{2,4}\b')  # Turkish plate: 34 ABC 1234
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+OCR_PATTERNS = (VIN_RE, PLATE_RE, YEAR_RE)
+
+def _compile_ocr_patterns() -> "hyperscan.Database":
+    """Compile OCR_PATTERNS into one Hyperscan database reporting match starts"""
+    hs_db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    hs_db.compile(
+        expressions=[p.pattern.encode() for p in OCR_PATTERNS],
+        ids=list(range(len(OCR_PATTERNS))),
+        elements=len(OCR_PATTERNS),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(OCR_PATTERNS)
+    )
+    return hs_db
+
+OCR_HS_DB = None
+if hyperscan is not None:
+    try:
+        OCR_HS_DB = _compile_ocr_patterns()
+    except hyperscan.error:
+        logging.getLogger(__name__).exception("Hyperscan rejected OCR patterns, using re")
+
+# ASCII separators (FS/GS/RS/US) that Python's \s matches but Hyperscan's does not
+HS_UNSUPPORTED_RE = re.compile(r'[\x1c-\x1f]')
+
+# Largest decoded image accepted by the OCR endpoints
+MAX_OCR_IMAGE_BYTES = 10 * 1024 * 1024
+
+# Long edge OCR images are downscaled to; more pixels only cost Tesseract time
+OCR_MAX_EDGE = 2000
+
+# Formats Tesseract (Leptonica) decodes itself; anything else PIL opens is
+# re-encoded through pytesseract rather than handed over by path
+LEPTONICA_FORMATS = {"PNG", "JPEG", "TIFF", "BMP", "GIF", "PPM"}
+
+# Tesseract releases the GIL, so OCR runs in worker threads off the event loop
+OCR_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="ocr")
+_ocr_local = threading.local()
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Async handlers share connections efficiently, so a modest pool is enough.
+# Keep a few warm connections to avoid handshake latency on the first queries,
+# cap the pool to bound memory, and fail fast instead of queueing forever.
+client = AsyncMongoClient(
+    mongo_url,
+    minPoolSize=5,
+    maxPoolSize=50,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=5000,
+    waitQueueTimeoutMS=2000,
+    tz_aware=True  # return stored dates as UTC-aware datetimes
+)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix (orjson serializes large list responses faster)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -98,6 +168,10 @@ class SaveVehicleRequest(BaseModel):
 
 # ==================== AUTHENTICATION ====================
 
+# Short-lived cache of session_token -> (User, expires_at) so bursts of
+# requests from the same client skip the two Mongo lookups below
+SESSION_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
 async def get_current_user(
     request: Request,
     authorization: Optional[str] = Header(None)
@@ -118,33 +192,32 @@ async def get_current_user(
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Find session
+    now = datetime.now(timezone.utc)
+    cached = SESSION_CACHE.get(session_token)
+    if cached and cached[1] > now:
+        return cached[0]
+    
+    # Find unexpired session (the TTL index purges expired ones in the background)
     session = await db.user_sessions.find_one(
-        {"session_token": session_token},
-        {"_id": 0}
+        {"session_token": session_token, "expires_at": {"$gt": now}},
+        {"_id": 0, "user_id": 1, "expires_at": 1}
     )
     
     if not session:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    # Check expiry (timezone-aware)
-    expires_at = session["expires_at"]
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
-    
-    if expires_at < datetime.now(timezone.utc):
-        raise HTTPException(status_code=401, detail="Session expired")
+        raise HTTPException(status_code=401, detail="Invalid or expired session")
     
     # Get user
     user_doc = await db.users.find_one(
         {"user_id": session["user_id"]},
-        {"_id": 0}
+        {"_id": 0, "user_id": 1, "email": 1, "name": 1, "picture": 1, "created_at": 1}
     )
     
     if not user_doc:
         raise HTTPException(status_code=401, detail="User not found")
     
-    return User(**user_doc)
+    user = User(**user_doc)
+    SESSION_CACHE[session_token] = (user, session["expires_at"])
+    return user
 
 @api_router.post("/auth/session")
 async def exchange_session(request: Request, response: Response):
@@ -154,42 +227,48 @@ async def exchange_session(request: Request, response: Response):
     if not session_id:
         raise HTTPException(status_code=400, detail="Missing session_id")
     
-    # Call Emergent Auth API
-    async with httpx.AsyncClient() as client:
-        try:
-            auth_response = await client.get(
-                "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
-                headers={"X-Session-ID": session_id},
-                timeout=10.0
-            )
-            auth_response.raise_for_status()
-            user_data = auth_response.json()
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to validate session: {str(e)}")
-    
-    # Create or get user
-    user_id = f"user_{uuid.uuid4().hex[:12]}"
-    existing_user = await db.users.find_one({"email": user_data["email"]}, {"_id": 0})
-    
-    if not existing_user:
-        await db.users.insert_one({
-            "user_id": user_id,
+    # Call Emergent Auth API (shared client keeps connections alive across logins)
+    try:
+        auth_response = await app.state.http.get(
+            "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
+            headers={"X-Session-ID": session_id}
+        )
+        auth_response.raise_for_status()
+        user_data = auth_response.json()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to validate session: {str(e)}")
+    
+    now = datetime.now(timezone.utc)
+    
+    # Create or get user; upserts keyed on the unique fields make repeated
+    # or concurrent exchanges of the same login safe
+    user = await db.users.find_one_and_update(
+        {"email": user_data["email"]},
+        {"$setOnInsert": {
+            "user_id": f"user_{uuid.uuid4().hex[:12]}",
             "email": user_data["email"],
             "name": user_data["name"],
             "picture": user_data.get("picture"),
-            "created_at": datetime.now(timezone.utc)
-        })
-    else:
-        user_id = existing_user["user_id"]
+            "created_at": now
+        }},
+        projection={"_id": 0, "user_id": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    user_id = user["user_id"]
     
-    # Create session
+    # Create session (exchanging the same session_id twice is a no-op)
     session_token = user_data["session_token"]
-    await db.user_sessions.insert_one({
-        "user_id": user_id,
-        "session_token": session_token,
-        "expires_at": datetime.now(timezone.utc) + timedelta(days=7),
-        "created_at": datetime.now(timezone.utc)
-    })
+    await db.user_sessions.update_one(
+        {"session_token": session_token},
+        {"$setOnInsert": {
+            "user_id": user_id,
+            "session_token": session_token,
+            "expires_at": now + timedelta(days=7),
+            "created_at": now
+        }},
+        upsert=True
+    )
     
     # Set cookie
     response.set_cookie(
@@ -214,16 +293,48 @@ async def logout(request: Request, response: Response, current_user: User = Depe
     session_token = request.cookies.get("session_token")
     
     if session_token:
+        SESSION_CACHE.pop(session_token, None)
         await db.user_sessions.delete_one({"session_token": session_token})
     
     response.delete_cookie("session_token")
     return {"message": "Logged out successfully"}
 
+# ==================== DATABASE INDEXES ====================
+
+# Case-insensitive string comparison; queries must pass the same collation
+# to use indexes built with it
+CASE_INSENSITIVE = {"locale": "en", "strength": 2}
+
+# (collection, keys, create_index options)
+INDEXES = [
+    ("user_sessions", "session_token", {"unique": True}),
+    ("user_sessions", "expires_at", {"expireAfterSeconds": 0}),
+    ("users", "user_id", {"unique": True}),
+    ("users", "email", {"unique": True}),
+    ("vehicles", "vehicle_id", {"unique": True}),
+    ("vehicles", [("brand", 1), ("model", 1), ("year", 1)], {}),
+    ("vehicles", [("brand", 1), ("model", 1), ("year", 1)],
+     {"name": "brand_model_year_ci", "collation": CASE_INSENSITIVE}),
+    ("saved_vehicles", [("user_id", 1), ("saved_at", -1)], {}),
+    ("saved_vehicles", "saved_id", {"unique": True}),
+    ("price_trends", "vehicle_id", {"unique": True}),
+]
+
+async def ensure_indexes():
+    """Create indexes for hot lookup fields (no-op if they already exist).
+    A failing index (e.g. a unique index over existing duplicates) is logged
+    and skipped so the server still starts"""
+    for collection, keys, options in INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+        except OperationFailure:
+            logger.exception("Failed to create index %s on %s", keys, collection)
+
 # ==================== VEHICLE DATA INITIALIZATION ====================
 
 async def initialize_mock_data():
     """Initialize Turkish vehicle market mock data"""
-    existing = await db.vehicles.count_documents({})
+    existing = await db.vehicles.estimated_document_count()
     if existing > 0:
         return
     
@@ -287,15 +398,18 @@ async def initialize_mock_data():
         {"brand": "Toyota", "model": "Corolla", "year": 2020, "base_price": 780000, "average_mileage": 62000, "category": "sedan"},
     ]
     
+    now = datetime.now(timezone.utc)
+    
     vehicles_to_insert = []
     for vehicle_data in mock_vehicles:
         vehicle_data["vehicle_id"] = f"veh_{uuid.uuid4().hex[:12]}"
-        vehicle_data["created_at"] = datetime.now(timezone.utc)
+        vehicle_data["created_at"] = now
         vehicles_to_insert.append(vehicle_data)
     
     await db.vehicles.insert_many(vehicles_to_insert)
     
     # Create price history for trending data
+    trend_docs = []
     for vehicle in vehicles_to_insert[:10]:  # Add history for first 10 vehicles
         price_history = []
         base_price = vehicle["base_price"]
@@ -303,7 +417,7 @@ async def initialize_mock_data():
         # Generate 12 months of price history
         for i in range(12):
             months_ago = 12 - i
-            date = datetime.now(timezone.utc) - timedelta(days=months_ago * 30)
+            date = now - timedelta(days=months_ago * 30)
             # Simulate gradual price changes
             price_variation = base_price * (0.9 + (i * 0.01))  # Gradual increase
             price_history.append({
@@ -312,20 +426,44 @@ async def initialize_mock_data():
                 "mileage": vehicle["average_mileage"] - (months_ago * 1000)
             })
         
-        await db.price_trends.insert_one({
+        trend_docs.append({
             "vehicle_id": vehicle["vehicle_id"],
             "brand": vehicle["brand"],
             "model": vehicle["model"],
             "year": vehicle["year"],
             "price_history": price_history,
-            "updated_at": datetime.now(timezone.utc)
+            "updated_at": now
         })
+    
+    await db.price_trends.insert_many(trend_docs)
+    logger.info("Mock data initialized")
 
 # ==================== PRICING ALGORITHM ====================
 
-def calculate_vehicle_value(base_price: float, year: int, mileage: int, condition: str, market_trend: float = 1.0) -> Dict:
+CURRENT_YEAR = 2025
+
+# Condition multipliers, indexed by condition id
+CONDITIONS = ['excellent', 'good', 'fair', 'poor']
+CONDITION_FACTORS = np.array([1.15, 1.0, 0.85, 0.70])
+_CONDITION_IDS = {name: i for i, name in enumerate(CONDITIONS)}
+_DEFAULT_CONDITION_ID = _CONDITION_IDS['good']
+
+def condition_ids(conditions: List[str]) -> np.ndarray:
+    """Map condition names to CONDITION_FACTORS indices (unknown -> good)"""
+    return np.array(
+        [_CONDITION_IDS.get(c.lower(), _DEFAULT_CONDITION_ID) for c in conditions],
+        dtype=np.intp
+    )
+
+def calculate_vehicle_value_batch(
+    base_prices: np.ndarray,
+    years: np.ndarray,
+    mileages: np.ndarray,
+    condition_idx: np.ndarray,
+    market_trends: Any = 1.0
+) -> Dict[str, np.ndarray]:
     """
-    Advanced vehicle valuation algorithm
+    Vectorized vehicle valuation, element-wise over equally sized arrays
     
     Factors:
     - Year-based depreciation (15-20% first year, 10-15% subsequent years)
@@ -333,42 +471,57 @@ def calculate_vehicle_value(base_price: float, year: int, mileage: int, conditio
     - Condition multiplier (excellent: 1.15, good: 1.0, fair: 0.85, poor: 0.70)
     - Market trend factor
     """
-    current_year = 2025
-    age = current_year - year
-    
-    # Year-based depreciation
-    if age == 0:
-        depreciation = 0
-    elif age == 1:
-        depreciation = 0.175  # 17.5% first year
-    else:
-        # 17.5% first year + 12.5% for each subsequent year
-        depreciation = 0.175 + (age - 1) * 0.125
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    mileages = np.asarray(mileages, dtype=np.int64)
+    age = CURRENT_YEAR - np.asarray(years, dtype=np.int64)
+    
+    # Year-based depreciation: 17.5% first year + 12.5% for each subsequent year
+    depreciation = np.where(age == 0, 0.0, 0.175 + (age - 1) * 0.125)
     
     # Cap depreciation at 85%
-    depreciation = min(depreciation, 0.85)
+    depreciation = np.minimum(depreciation, 0.85)
     
     # Mileage impact (per 10,000 km over expected)
     expected_mileage = age * 15000  # 15k km/year average in Turkey
-    excess_mileage = max(0, mileage - expected_mileage)
+    excess_mileage = np.maximum(0, mileages - expected_mileage)
     mileage_penalty = (excess_mileage / 10000) * 0.02  # 2% per 10k excess
-    mileage_penalty = min(mileage_penalty, 0.30)  # Cap at 30%
+    mileage_penalty = np.minimum(mileage_penalty, 0.30)  # Cap at 30%
     
     # Condition multiplier
-    condition_factors = {
-        'excellent': 1.15,
-        'good': 1.0,
-        'fair': 0.85,
-        'poor': 0.70
-    }
-    condition_factor = condition_factors.get(condition.lower(), 1.0)
+    condition_factor = CONDITION_FACTORS[np.asarray(condition_idx, dtype=np.intp)]
     
     # Calculate final value
-    depreciated_value = base_price * (1 - depreciation - mileage_penalty)
-    final_value = depreciated_value * condition_factor * market_trend
+    depreciated_value = base_prices * (1 - depreciation - mileage_penalty)
+    final_value = depreciated_value * condition_factor * market_trends
     
     # Floor at 15% of original price
-    final_value = max(final_value, base_price * 0.15)
+    final_value = np.maximum(final_value, base_prices * 0.15)
+    
+    return {
+        "age": age,
+        "depreciation": depreciation,
+        "expected_mileage": expected_mileage,
+        "excess_mileage": excess_mileage,
+        "mileage_penalty": mileage_penalty,
+        "condition_factor": condition_factor,
+        "depreciated_value": depreciated_value,
+        "final_value": final_value
+    }
+
+def calculate_vehicle_value(base_price: float, year: int, mileage: int, condition: str, market_trend: float = 1.0) -> Dict:
+    """Value a single vehicle (see calculate_vehicle_value_batch)"""
+    r = calculate_vehicle_value_batch(
+        np.array([base_price]),
+        np.array([year]),
+        np.array([mileage]),
+        condition_ids([condition]),
+        market_trend
+    )
+    depreciation = float(r["depreciation"][0])
+    mileage_penalty = float(r["mileage_penalty"][0])
+    condition_factor = float(r["condition_factor"][0])
+    depreciated_value = float(r["depreciated_value"][0])
+    final_value = float(r["final_value"][0])
     
     return {
         "estimated_value": round(final_value, 2),
@@ -378,10 +531,10 @@ def calculate_vehicle_value(base_price: float, year: int, mileage: int, conditio
         "market_trend": market_trend,
         "breakdown": {
             "base_price": base_price,
-            "age_years": age,
-            "expected_mileage": expected_mileage,
+            "age_years": int(r["age"][0]),
+            "expected_mileage": int(r["expected_mileage"][0]),
             "actual_mileage": mileage,
-            "excess_mileage": excess_mileage,
+            "excess_mileage": int(r["excess_mileage"][0]),
             "depreciated_value": round(depreciated_value, 2),
             "after_condition": round(depreciated_value * condition_factor, 2),
             "final_value": round(final_value, 2)
@@ -404,10 +557,13 @@ async def search_vehicles(
     """Search vehicles with filters"""
     query = {}
     
+    # Prefix matches only: user input is escaped, so it cannot inject regex
+    # syntax or trigger catastrophic backtracking. Case-insensitive regexes
+    # still cannot use tight index bounds; this is about safety, not speed.
     if brand:
-        query["brand"] = {"$regex": brand, "$options": "i"}
+        query["brand"] = {"$regex": f"^{re.escape(brand)}", "$options": "i"}
     if model:
-        query["model"] = {"$regex": model, "$options": "i"}
+        query["model"] = {"$regex": f"^{re.escape(model)}", "$options": "i"}
     if year_min or year_max:
         query["year"] = {}
         if year_min:
@@ -423,7 +579,8 @@ async def search_vehicles(
     if category:
         query["category"] = category
     
-    vehicles = await db.vehicles.find(query, {"_id": 0}).limit(50).to_list(50)
+    # List results never embed images; they can be hundreds of KB per vehicle
+    vehicles = await db.vehicles.find(query, {"_id": 0, "image_base64": 0}).limit(50).to_list(50)
     return vehicles
 
 @api_router.get("/vehicles/brands")
@@ -441,19 +598,22 @@ async def get_models(brand: str, current_user: User = Depends(get_current_user))
 @api_router.get("/vehicles/saved")
 async def get_saved_vehicles(current_user: User = Depends(get_current_user)):
     """Get user's saved vehicles"""
-    saved = await db.saved_vehicles.find(
-        {"user_id": current_user.user_id},
-        {"_id": 0}
-    ).sort("saved_at", -1).to_list(100)
-    
-    # Enrich with vehicle details
-    for item in saved:
-        vehicle = await db.vehicles.find_one(
-            {"vehicle_id": item["vehicle_id"]},
-            {"_id": 0}
-        )
-        if vehicle:
-            item["vehicle_details"] = vehicle
+    # Enrich with vehicle details in a single round-trip
+    pipeline = [
+        {"$match": {"user_id": current_user.user_id}},
+        {"$sort": {"saved_at": -1}},
+        {"$limit": 100},
+        {"$lookup": {
+            "from": "vehicles",
+            "localField": "vehicle_id",
+            "foreignField": "vehicle_id",
+            "as": "vehicle_details"
+        }},
+        {"$unwind": {"path": "$vehicle_details", "preserveNullAndEmptyArrays": True}},
+        {"$project": {"_id": 0, "vehicle_details._id": 0, "vehicle_details.image_base64": 0}}
+    ]
+    cursor = await db.saved_vehicles.aggregate(pipeline)
+    saved = await cursor.to_list(100)
     
     return saved
 
@@ -471,22 +631,21 @@ async def calculate_valuation(
     current_user: User = Depends(get_current_user)
 ):
     """Calculate vehicle valuation"""
-    # Find similar vehicle in database for base price
-    vehicle = await db.vehicles.find_one({
-        "brand": {"$regex": f"^{request.brand}$", "$options": "i"},
-        "model": {"$regex": f"^{request.model}$", "$options": "i"},
-        "year": request.year
-    }, {"_id": 0})
+    # Find same brand/model in database for base price, preferring the
+    # requested year and otherwise the closest one
+    pipeline = [
+        {"$match": {"brand": request.brand, "model": request.model}},
+        {"$addFields": {"year_distance": {"$abs": {"$subtract": ["$year", request.year]}}}},
+        {"$sort": {"year_distance": 1, "year": -1}},
+        {"$limit": 1},
+        {"$project": {"_id": 0, "base_price": 1}}
+    ]
+    cursor = await db.vehicles.aggregate(pipeline, collation=CASE_INSENSITIVE)
+    matches = await cursor.to_list(1)
     
-    if not vehicle:
-        # Find closest match by brand and model
-        vehicle = await db.vehicles.find_one({
-            "brand": {"$regex": f"^{request.brand}$", "$options": "i"},
-            "model": {"$regex": f"^{request.model}$", "$options": "i"}
-        }, {"_id": 0})
-        
-        if not vehicle:
-            raise HTTPException(status_code=404, detail="Vehicle not found in database")
+    if not matches:
+        raise HTTPException(status_code=404, detail="Vehicle not found in database")
+    vehicle = matches[0]
     
     # Calculate valuation
     result = calculate_vehicle_value(
@@ -506,6 +665,35 @@ async def get_price_trends(vehicle_id: str, current_user: User = Depends(get_cur
         raise HTTPException(status_code=404, detail="Price trends not found")
     return trends
 
+@api_router.get("/vehicles/{vehicle_id}/image")
+async def get_vehicle_image(vehicle_id: str, current_user: User = Depends(get_current_user)):
+    """Get vehicle image as binary (kept out of list responses)"""
+    vehicle = await db.vehicles.find_one(
+        {"vehicle_id": vehicle_id},
+        {"_id": 0, "image_base64": 1}
+    )
+    image_base64 = vehicle.get("image_base64") if vehicle else None
+    if not image_base64:
+        raise HTTPException(status_code=404, detail="Vehicle image not found")
+    
+    # Accept both raw base64 and data URIs (data:image/png;base64,...)
+    media_type = "image/jpeg"
+    if image_base64.startswith("data:"):
+        header, _, image_base64 = image_base64.partition(",")
+        media_type = header[5:].split(";")[0] or media_type
+    
+    try:
+        content = base64.b64decode(image_base64)
+    except binascii.Error as e:
+        raise HTTPException(status_code=500, detail=f"Stored vehicle image is corrupt: {str(e)}")
+    
+    # private: the endpoint is authenticated, so shared caches must not keep it
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Cache-Control": "private, max-age=86400"}
+    )
+
 # ==================== SAVED VEHICLES ====================
 
 @api_router.post("/vehicles/save")
@@ -543,6 +731,98 @@ async def delete_saved_vehicle(saved_id: str, current_user: User = Depends(get_c
 
 # ==================== OCR ENDPOINTS ====================
 
+def _tess_api() -> "tesserocr.PyTessBaseAPI":
+    """Get the calling OCR worker's tesserocr API, loading the model once per thread"""
+    api = getattr(_ocr_local, "api", None)
+    if api is None:
+        api = _ocr_local.api = tesserocr.PyTessBaseAPI()
+    return api
+
+def _prepare_image(img: Image.Image) -> Image.Image:
+    """Grayscale and downscale an image to the size Tesseract actually needs"""
+    img = img.convert('L')
+    if max(img.size) > OCR_MAX_EDGE:
+        img.thumbnail((OCR_MAX_EDGE, OCR_MAX_EDGE), Image.Resampling.LANCZOS)
+    return img
+
+def _ocr_image(image_data: bytes, suffix: Optional[str] = None) -> str:
+    """Run Tesseract on image bytes (blocking, runs in OCR_POOL)
+
+    Uses tesserocr when installed so the language model stays loaded between
+    scans. Otherwise falls back to pytesseract; when the file extension is
+    known, the format is one Leptonica reads and the image needs no
+    downscaling, the raw bytes are handed to Tesseract as a file path,
+    skipping the PIL decode and PNG re-encode pytesseract performs for
+    in-memory images. That path skips grayscale conversion too, which
+    Tesseract's own binarization makes redundant.
+    """
+    img = Image.open(BytesIO(image_data))  # lazy, only the header is read here
+    
+    if tesserocr is not None:
+        api = _tess_api()
+        api.SetImage(_prepare_image(img))
+        return api.GetUTF8Text()
+    
+    if not suffix or img.format not in LEPTONICA_FORMATS or max(img.size) > OCR_MAX_EDGE:
+        return pytesseract.image_to_string(_prepare_image(img))
+    
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        tmp.write(image_data)
+    try:
+        return pytesseract.image_to_string(tmp.name)
+    finally:
+        os.unlink(tmp.name)
+
+async def run_ocr(image_data: bytes, suffix: Optional[str] = None) -> str:
+    """Run OCR without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(OCR_POOL, _ocr_image, image_data, suffix)
+
+def _search_fields(detected_text: str, upper_text: str) -> List[Optional[re.Match]]:
+    """First VIN, plate and year matches in OCR text
+    
+    With Hyperscan, all patterns are located in a single pass and re only
+    confirms the match at the leftmost start, giving the same result as
+    separate searches. Text where the engines disagree falls back to plain
+    re: non-ASCII text, since Hyperscan offsets are in bytes and its word
+    boundaries are ASCII-only, and the \x1c-\x1f separators, which only
+    Python counts as whitespace.
+    """
+    if OCR_HS_DB is None or not upper_text.isascii() or HS_UNSUPPORTED_RE.search(upper_text):
+        return [VIN_RE.search(upper_text), PLATE_RE.search(upper_text), YEAR_RE.search(detected_text)]
+    
+    starts: List[Optional[int]] = [None] * len(OCR_PATTERNS)
+    
+    def on_match(pattern_id, start, end, flags, context):
+        if starts[pattern_id] is None or start < starts[pattern_id]:
+            starts[pattern_id] = start
+    
+    OCR_HS_DB.scan(upper_text.encode('ascii'), match_event_handler=on_match)
+    return [
+        pattern.match(upper_text, start) if start is not None else None
+        for pattern, start in zip(OCR_PATTERNS, starts)
+    ]
+
+def _extract_fields(detected_text: str) -> Dict[str, Any]:
+    """Extract VIN, license plate and year from OCR text"""
+    upper_text = detected_text.upper()
+    vin_match, plate_match, year_match = _search_fields(detected_text, upper_text)
+    
+    vin = vin_match.group(0) if vin_match else None
+    license_plate = plate_match.group(0) if plate_match else None
+    year = int(year_match.group(0)) if year_match else None
+    
+    return {
+        "detected_text": detected_text,
+        "vin": vin,
+        "license_plate": license_plate,
+        "extracted_data": {
+            "year": year,
+            "has_vin": vin is not None,
+            "has_plate": license_plate is not None
+        }
+    }
+
 @api_router.post("/ocr/scan")
 async def scan_document(
     image: UploadFile = File(...),
@@ -552,36 +832,12 @@ async def scan_document(
     try:
         # Read image
         contents = await image.read()
-        img = Image.open(BytesIO(contents))
+        suffix = Path(image.filename).suffix if image.filename else None
         
         # Perform OCR
-        detected_text = pytesseract.image_to_string(img)
-        
-        # Extract VIN (17 characters, alphanumeric)
-        vin_pattern = r'\b[A-HJ-NPR-Z0-9]{17}\b'
-        vin_match = re.search(vin_pattern, detected_text.upper())
-        vin = vin_match.group(0) if vin_match else None
+        detected_text = await run_ocr(contents, suffix)
         
-        # Extract Turkish license plate (format: 34 ABC 1234)
-        plate_pattern = r'\b\d{2}\s*[A-Z]{1,3}\s*\d{2,4}\b'
-        plate_match = re.search(plate_pattern, detected_text.upper())
-        license_plate = plate_match.group(0) if plate_match else None
-        
-        # Try to extract year (4 digits)
-        year_pattern = r'\b(19|20)\d{2}\b'
-        year_match = re.search(year_pattern, detected_text)
-        year = int(year_match.group(0)) if year_match else None
-        
-        return {
-            "detected_text": detected_text,
-            "vin": vin,
-            "license_plate": license_plate,
-            "extracted_data": {
-                "year": year,
-                "has_vin": vin is not None,
-                "has_plate": license_plate is not None
-            }
-        }
+        return _extract_fields(detected_text)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR processing failed: {str(e)}")
@@ -592,54 +848,50 @@ async def scan_document_base64(
     current_user: User = Depends(get_current_user)
 ):
     """Scan vehicle document from base64 image"""
+    # Strip data-URI prefix without splitting the whole payload
+    image_base64 = request.image_base64
+    comma = image_base64.find(',')
+    if comma >= 0:
+        image_base64 = image_base64[comma + 1:]
+    
+    # Reject oversized images before decoding them
+    if len(image_base64) * 3 // 4 > MAX_OCR_IMAGE_BYTES:
+        raise HTTPException(status_code=413, detail="Image too large")
+    
     try:
-        # Decode base64
-        image_base64 = request.image_base64
-        if ',' in image_base64:
-            image_base64 = image_base64.split(',')[1]
-        
         image_data = base64.b64decode(image_base64)
-        img = Image.open(BytesIO(image_data))
         
         # Perform OCR
-        detected_text = pytesseract.image_to_string(img)
+        detected_text = await run_ocr(image_data)
         
-        # Extract VIN
-        vin_pattern = r'\b[A-HJ-NPR-Z0-9]{17}\b'
-        vin_match = re.search(vin_pattern, detected_text.upper())
-        vin = vin_match.group(0) if vin_match else None
-        
-        # Extract Turkish license plate
-        plate_pattern = r'\b\d{2}\s*[A-Z]{1,3}\s*\d{2,4}\b'
-        plate_match = re.search(plate_pattern, detected_text.upper())
-        license_plate = plate_match.group(0) if plate_match else None
-        
-        # Extract year
-        year_pattern = r'\b(19|20)\d{2}\b'
-        year_match = re.search(year_pattern, detected_text)
-        year = int(year_match.group(0)) if year_match else None
-        
-        return {
-            "detected_text": detected_text,
-            "vin": vin,
-            "license_plate": license_plate,
-            "extracted_data": {
-                "year": year,
-                "has_vin": vin is not None,
-                "has_plate": license_plate is not None
-            }
-        }
+        return _extract_fields(detected_text)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR processing failed: {str(e)}")
 
 # ==================== STARTUP ====================
 
+def _log_seed_failure(task: asyncio.Task):
+    """Surface errors from the background seed task, which nothing awaits"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Mock data initialization failed", exc_info=task.exception())
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize data on startup"""
-    await initialize_mock_data()
-    logger.info("Mock data initialized")
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    try:
+        await ensure_indexes()
+    except PyMongoError:
+        # e.g. MongoDB unreachable at boot; serve anyway and let requests fail
+        logger.exception("Failed to ensure indexes")
+    # Seed in the background so the server accepts traffic immediately;
+    # keep a reference so the task is not garbage collected mid-run
+    app.state.mock_data_task = asyncio.create_task(initialize_mock_data())
+    app.state.mock_data_task.add_done_callback(_log_seed_failure)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -661,4 +913,6 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    await app.state.http.aclose()
+    OCR_POOL.shutdown(wait=False)
+    await client.close()